@@ -1,140 +1,482 @@
+import mmap
 import os
+import re
+import struct
+import subprocess
 import zlib
 import xml.etree.ElementTree as ET
-from hashlib import sha1
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import Dict, Iterator, List, Tuple
+
+def _parse_ts(s: str) -> datetime:
+    """Разобрать дату формата 'ГГГГ-ММ-ДД ЧЧ:ММ:СС' прямыми срезами.
+
+    strptime интерпретирует строку формата при каждом вызове и на порядок
+    медленнее, чем срезы с int() для заранее известного формата.
+    """
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]))
 
 def load_config_from_xml(config_path: str) -> Dict[str, str]:
     """Загрузить конфигурацию из XML файла и преобразовать дату коммита в формат datetime."""
     tree = ET.parse(config_path)
     root = tree.getroot()
-    
-    # Загружаем конфигурацию и преобразуем дату коммита в datetime
+
+    # Один проход по детям корня вместо пяти линейных поисков root.find()
+    children = {child.tag: child for child in root}
+
     config = {
-        "visualization_tool": root.find('visualization_tool').text,
-        "repository_path": root.find('repository_path').text,
-        "output_image_path": root.find('output_image_path').text,
-        "commit_dates": datetime.strptime(root.find('commit_dates').text, '%Y-%m-%d %H:%M:%S'),
-        "tag_names": [tag.text for tag in root.find('tag_names').findall('tag')]
+        "visualization_tool": children['visualization_tool'].text,
+        "repository_path": children['repository_path'].text,
+        "output_image_path": children['output_image_path'].text,
+        "commit_dates": _parse_ts(children['commit_dates'].text),
+        "tag_names": [tag.text for tag in children['tag_names']]
     }
     return config
 
-def read_git_object(repo_path: str, object_hash: str) -> str:
-    """Читать объект Git и возвращать его содержимое как строку."""
-    object_path = os.path.join(repo_path, '.git', 'objects', object_hash[:2], object_hash[2:])
+# Минимальный размер loose-файла, при котором чтение идёт через mmap
+_MMAP_MIN_SIZE = 8192
+
+def _inflate(compressed_contents) -> bytes:
+    """Распаковать объект Git, подсказывая zlib итоговый размер.
+
+    Заголовок объекта "тип размер\\x00" содержит точную длину содержимого,
+    поэтому сначала распаковываются первые байты, из них читается размер,
+    а остаток распаковывается сразу в буфер нужной длины — без повторных
+    довыделений выходного буфера внутри zlib.
+    """
+    decompressor = zlib.decompressobj()
+    head = decompressor.decompress(compressed_contents, 64)
+    try:
+        header_end = head.index(b'\x00')
+        size = int(head[head.index(b' ') + 1:header_end])
+    except ValueError:
+        # Заголовок не распознан — распаковываем без подсказки
+        return head + decompressor.decompress(decompressor.unconsumed_tail) + decompressor.flush()
+    remaining = size - (len(head) - header_end - 1)
+    return head + decompressor.decompress(decompressor.unconsumed_tail, remaining) + decompressor.flush()
+
+# Типы объектов в packfile: 6 и 7 — дельты, разрешаются отдельно
+_PACK_TYPE_NAMES = {1: b'commit', 2: b'tree', 3: b'blob', 4: b'tag'}
+
+_pack_index_cache: Dict[str, Tuple[float, Dict[str, Tuple[str, int]]]] = {}
+_pack_mmaps: Dict[str, mmap.mmap] = {}
+
+def _load_pack_indexes(repo_path: str) -> Dict[str, Tuple[str, int]]:
+    """Построить карту {хеш: (путь к pack-файлу, смещение)} по всем .idx.
+
+    Каждый индекс отображается в память один раз; из версии 2 читаются
+    таблица fanout, хеши и смещения (включая таблицу больших смещений).
+    """
+    pack_dir = os.path.join(repo_path, '.git', 'objects', 'pack')
+    try:
+        mtime = os.path.getmtime(pack_dir)
+    except FileNotFoundError:
+        return {}
+    cached = _pack_index_cache.get(repo_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    index = {}
+    with os.scandir(pack_dir) as entries:
+        idx_files = [entry.path for entry in entries if entry.name.endswith('.idx')]
+    for idx_path in idx_files:
+        with open(idx_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:4] != b'\xfftOc' or struct.unpack('>I', mm[4:8])[0] != 2:
+                    continue  # поддерживаем только индексы версии 2
+                total = struct.unpack('>I', mm[8 + 255 * 4:8 + 256 * 4])[0]
+                sha_start = 8 + 256 * 4
+                offsets_start = sha_start + total * 20 + total * 4
+                large_start = offsets_start + total * 4
+                pack_path = idx_path[:-4] + '.pack'
+                for i in range(total):
+                    sha = mm[sha_start + i * 20:sha_start + (i + 1) * 20].hex()
+                    offset = struct.unpack('>I', mm[offsets_start + i * 4:offsets_start + (i + 1) * 4])[0]
+                    if offset & 0x80000000:
+                        # Старший бит взведён: настоящие 8 байт лежат в отдельной таблице
+                        j = offset & 0x7fffffff
+                        offset = struct.unpack('>Q', mm[large_start + j * 8:large_start + (j + 1) * 8])[0]
+                    index[sha] = (pack_path, offset)
+
+    _pack_index_cache[repo_path] = (mtime, index)
+    return index
+
+def _pack_mmap(pack_path: str) -> mmap.mmap:
+    """Отобразить pack-файл в память один раз и переиспользовать отображение."""
+    mm = _pack_mmaps.get(pack_path)
+    if mm is None:
+        with open(pack_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _pack_mmaps[pack_path] = mm
+    return mm
+
+def _inflate_stream(mm: mmap.mmap, start: int) -> bytes:
+    """Распаковать один zlib-поток из pack-файла, читая его по кускам."""
+    decompressor = zlib.decompressobj()
+    parts = []
+    position = start
+    while not decompressor.eof:
+        chunk = mm[position:position + 65536]
+        if not chunk:
+            break
+        parts.append(decompressor.decompress(chunk))
+        position += 65536
+    return b''.join(parts)
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Применить дельту из pack-файла к базовому объекту."""
+    position = 0
+
+    def read_varint():
+        nonlocal position
+        value = shift = 0
+        while True:
+            byte = delta[position]
+            position += 1
+            value |= (byte & 0x7f) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value
+
+    read_varint()  # размер базового объекта — не нужен для применения
+    result_size = read_varint()
+
+    parts = []
+    while position < len(delta):
+        opcode = delta[position]
+        position += 1
+        if opcode & 0x80:
+            # Копирование из базы: смещение и длина собираются по взведённым битам
+            copy_offset = copy_size = 0
+            for bit in range(4):
+                if opcode & (1 << bit):
+                    copy_offset |= delta[position] << (bit * 8)
+                    position += 1
+            for bit in range(3):
+                if opcode & (0x10 << bit):
+                    copy_size |= delta[position] << (bit * 8)
+                    position += 1
+            if copy_size == 0:
+                copy_size = 0x10000
+            parts.append(base[copy_offset:copy_offset + copy_size])
+        elif opcode:
+            # Вставка литеральных байтов из самой дельты
+            parts.append(delta[position:position + opcode])
+            position += opcode
+        else:
+            raise Exception("Invalid delta opcode 0.")
+
+    result = b''.join(parts)
+    if len(result) != result_size:
+        raise Exception("Delta application produced an object of unexpected size.")
+    return result
+
+def _read_pack_entry(repo_path: str, pack_path: str, offset: int) -> Tuple[bytes, bytes]:
+    """Прочитать объект из pack-файла по смещению: (тип, содержимое)."""
+    mm = _pack_mmap(pack_path)
+
+    byte = mm[offset]
+    obj_type = (byte >> 4) & 0x7
+    position = offset + 1
+    while byte & 0x80:
+        byte = mm[position]
+        position += 1
+
+    if obj_type == 6:  # OFS_DELTA: база лежит в этом же pack-файле выше по смещению
+        byte = mm[position]
+        position += 1
+        back = byte & 0x7f
+        while byte & 0x80:
+            byte = mm[position]
+            position += 1
+            back = ((back + 1) << 7) | (byte & 0x7f)
+        base_type, base = _read_pack_entry(repo_path, pack_path, offset - back)
+        return base_type, _apply_delta(base, _inflate_stream(mm, position))
+
+    if obj_type == 7:  # REF_DELTA: база задана хешем и может быть где угодно
+        base_hash = mm[position:position + 20].hex()
+        position += 20
+        base_raw = read_git_object(repo_path, base_hash)
+        base_header, _, base = base_raw.partition(b'\x00')
+        return base_header.split(b' ', 1)[0], _apply_delta(base, _inflate_stream(mm, position))
+
+    try:
+        return _PACK_TYPE_NAMES[obj_type], _inflate_stream(mm, position)
+    except KeyError:
+        raise Exception(f"Unsupported pack object type {obj_type}.")
+
+def _read_packed_object(repo_path: str, object_hash: str) -> bytes:
+    """Найти объект в pack-файлах и вернуть его в формате loose-объекта."""
+    entry = _load_pack_indexes(repo_path).get(object_hash)
+    if entry is None:
+        raise FileNotFoundError(object_hash)
+    type_name, content = _read_pack_entry(repo_path, entry[0], entry[1])
+    # Восстанавливаем заголовок "тип размер\0", чтобы формат совпадал с loose
+    return type_name + b' ' + str(len(content)).encode('ascii') + b'\x00' + content
+
+@lru_cache(maxsize=4096)
+def read_git_object(repo_path: str, object_hash: str) -> bytes:
+    """Читать объект Git и возвращать его содержимое как байты.
+
+    Объекты Git неизменяемы (адресуются по содержимому), поэтому результат
+    кэшируется: повторные обращения к одному коммиту не тратят время на
+    чтение файла и распаковку zlib. Декодирование в str откладывается до
+    момента, когда текст действительно нужен.
+    """
+    object_path = f"{repo_path}/.git/objects/{object_hash[:2]}/{object_hash[2:]}"
     try:
         with open(object_path, 'rb') as f:
+            # Крупные loose-объекты распаковываем прямо из страничного кэша
+            # через mmap, без копии в байтовую строку; для мелких (типичный
+            # коммит) накладные расходы mmap выше экономии — читаем как раньше
+            if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _inflate(mm)
             compressed_contents = f.read()
-            decompressed_contents = zlib.decompress(compressed_contents)
-            return decompressed_contents.decode('utf-8')
+            return _inflate(compressed_contents)
     except FileNotFoundError:
-        raise Exception(f"Object {object_hash} not found.")
+        # Loose-файла нет — большинство объектов реального репозитория лежит в pack-файлах
+        try:
+            return _read_packed_object(repo_path, object_hash)
+        except FileNotFoundError:
+            raise Exception(f"Object {object_hash} not found.")
     except Exception as e:
         raise Exception(f"Error reading object {object_hash}: {str(e)}")
 
-def get_commit_data(repo_path: str, commit_hash: str) -> Tuple[str, str, str, str]:
-    """Получить данные коммита: хеш, дата, автор, сообщение."""
+def read_git_objects_bulk(repo_path: str, hashes: List[str]) -> Dict[str, bytes]:
+    """Прочитать несколько объектов Git одновременно.
+
+    Мелкие loose-объекты ограничены задержкой open/read, поэтому чтения
+    отправляются пачкой в пул потоков. Каждое чтение идёт через
+    read_git_object, так что содержимое остаётся в его кэше для
+    последующих одиночных обращений.
+    """
+    if not hashes:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(64, len(hashes))) as executor:
+        contents = executor.map(lambda h: read_git_object(repo_path, h), hashes)
+        return dict(zip(hashes, contents))
+
+# Скомпилированные шаблоны для заголовка коммита: поиск идёт одним проходом
+# движка re по буферу вместо построчных сравнений на уровне Python
+_AUTHOR_RE = re.compile(rb'\nauthor ([^\n]+?) (\d+) [+-]\d+(?=\n|$)')
+_PARENT_RE = re.compile(rb'\nparent ([0-9a-f]{40})(?=\n|$)')
+
+# Поля коммита, извлекаемые по умолчанию; хеш, метка времени и родители
+# нужны самому обходу и парсятся всегда
+_ALL_FIELDS = frozenset(('author', 'message'))
+
+def get_commit_data(repo_path: str, commit_hash: str, *, need: frozenset = _ALL_FIELDS) -> Tuple[str, int, str, str, List[str]]:
+    """Получить данные коммита: хеш, метка времени, автор, сообщение, родительские хеши.
+
+    Через need вызывающий перечисляет нужные ему текстовые поля: если автор
+    или сообщение не запрошены, они не декодируются и возвращаются пустыми.
+    """
     commit_data = read_git_object(repo_path, commit_hash)
-    lines = commit_data.splitlines()
+
+    # Отделяем заголовок от сообщения одним поиском пустой строки: дальше
+    # работают C-примитивы bytes, а не построчный цикл с флагом
+    header, separator, body = commit_data.partition(b'\n\n')
     author = ""
-    date = ""
-    message = []
-    reading_message = False
-    
-    for line in lines:
-        if line.startswith("author "):
-            author_info = line.split("author ")[1]
-            author_name = author_info.rsplit(' ', 2)[0]
-            timestamp = author_info.rsplit(' ', 2)[1]
-
-            # Преобразуем временную метку в читаемый формат даты
-            date = datetime.fromtimestamp(int(timestamp)).strftime('%Y-%m-%d %H:%M:%S')
-            author = author_name
-        elif not line:
-            reading_message = True
-        elif reading_message:
-            message.append(line)
-    
-    return commit_hash, date, author, "\n".join(message)
+    timestamp = 0
 
-def get_tag_commit(repo_path: str, tag_name: str) -> str:
-    """Получить хеш коммита, связанный с указанным тегом."""
-    tag_path = os.path.join(repo_path, '.git', 'refs', 'tags', tag_name)
+    match = _AUTHOR_RE.search(header)
+    if match:
+        # Оставляем метку времени числом: strptime/strftime здесь лишние
+        timestamp = int(match.group(2))
+        if 'author' in need:
+            author = match.group(1).decode('utf-8', 'replace')
+    parents = [parent.decode('ascii') for parent in _PARENT_RE.findall(header)]
+
+    message = ""
+    if 'message' in need and separator:
+        message = body.rstrip(b'\n').decode('utf-8', 'replace')
+    return commit_hash, timestamp, author, message, parents
+
+_refs_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
+def _load_refs(repo_path: str) -> Dict[str, str]:
+    """Загрузить все теги репозитория одним проходом: сначала packed-refs,
+    затем отдельные файлы в refs/tags (они имеют приоритет)."""
+    git_dir = os.path.join(repo_path, '.git')
+    # Инвалидация по времени изменения .git: внутри одного запуска ссылки не меняются
+    mtime = os.path.getmtime(git_dir)
+    cached = _refs_cache.get(repo_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    refs = {}
+    packed_refs_path = os.path.join(git_dir, 'packed-refs')
     try:
-        with open(tag_path, 'r') as f:
-            return f.read().strip()
+        with open(packed_refs_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#') or line.startswith('^'):
+                    continue
+                sha, ref_name = line.split(' ', 1)
+                if ref_name.startswith('refs/tags/'):
+                    refs[ref_name[len('refs/tags/'):]] = sha
     except FileNotFoundError:
+        pass
+
+    tags_dir = os.path.join(git_dir, 'refs', 'tags')
+    try:
+        with os.scandir(tags_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    with open(entry.path, 'r') as f:
+                        refs[entry.name] = f.read().strip()
+    except FileNotFoundError:
+        pass
+
+    _refs_cache[repo_path] = (mtime, refs)
+    return refs
+
+def get_tag_commit(refs: Dict[str, str], tag_name: str) -> str:
+    """Получить хеш коммита, связанный с указанным тегом."""
+    try:
+        return refs[tag_name]
+    except KeyError:
         raise Exception(f"Tag {tag_name} not found.")
 
-def get_commits_between(repo_path: str, start_hash: str, min_date: datetime, end_hash: str = None) -> List[Tuple[str, str, str, str]]:
-    """Получить список коммитов между двумя хешами, фильтруя по дате."""
-    commits = []
+# Сколько подряд идущих коммитов старше min_date допускается до остановки обхода
+_STALE_STREAK_LIMIT = 50
+
+def get_commits_between(repo_path: str, start_hash: str, min_date: datetime, end_hash: str = None,
+                        need: frozenset = _ALL_FIELDS) -> Iterator[Tuple[str, int, str, str]]:
+    """Перечислить коммиты между двумя хешами (от новых к старым), фильтруя по дате.
+
+    Генератор не материализует всю историю: коммиты выдаются по одному,
+    в порядке обхода от start_hash к корню. Набор need пробрасывается в
+    get_commit_data и ограничивает извлекаемые текстовые поля.
+    """
     current_hash = start_hash
+    # Сравниваем числа с числами: min_date переводится в Unix-время один раз
+    min_timestamp = min_date.timestamp()
+    # Даты вдоль цепочки родителей убывают, но после слияний возможны
+    # одиночные выбросы — прекращаем обход только после серии старых коммитов
+    stale_streak = 0
 
     while current_hash:
-        commit_hash, commit_date, commit_author, commit_message = get_commit_data(repo_path, current_hash)
-        
-        # Преобразуем дату коммита в объект datetime и проверяем, соответствует ли она минимальной дате
-        commit_datetime = datetime.strptime(commit_date, '%Y-%m-%d %H:%M:%S')
-        if commit_datetime >= min_date:
-            commits.append((commit_hash, commit_date, commit_author, commit_message))
-        
-        # Получаем родительский коммит
-        commit_content = read_git_object(repo_path, current_hash)
-        parent_line = next((line for line in commit_content.splitlines() if line.startswith("parent ")), None)
-        
-        if parent_line:
-            current_hash = parent_line.split(" ")[1]
+        commit_hash, commit_timestamp, commit_author, commit_message, parents = get_commit_data(repo_path, current_hash, need=need)
+
+        if commit_timestamp >= min_timestamp:
+            yield commit_hash, commit_timestamp, commit_author, commit_message
+            stale_streak = 0
+        else:
+            stale_streak += 1
+            if stale_streak >= _STALE_STREAK_LIMIT:
+                break
+
+        # Переходим к родительскому коммиту, не перечитывая объект
+        if parents:
+            current_hash = parents[0]
             if current_hash == end_hash:
                 break
         else:
             break
 
-    return commits[::-1]  # Возвращаем список в прямом порядке
+@dataclass(slots=True)
+class CommitBatch:
+    """Коммиты одного тега в колоночном виде.
 
-def get_commits_for_tags(repo_path: str, tag_names: List[str], min_date: datetime) -> Dict[str, List[Tuple[str, str, str, str]]]:
+    Четыре параллельных списка вместо списка кортежей: потребителю, которому
+    нужны только хеши, не приходится перебирать кортежи с датами, авторами
+    и сообщениями ради элемента [0].
+    """
+    hashes: List[str] = field(default_factory=list)
+    dates: List[int] = field(default_factory=list)
+    authors: List[str] = field(default_factory=list)
+    messages: List[str] = field(default_factory=list)
+
+def _collect_commits(repo_path: str, start_hash: str, min_date: datetime, end_hash: str = None,
+                     need: frozenset = _ALL_FIELDS) -> CommitBatch:
+    """Собрать коммиты генератора в колонки в прямом хронологическом порядке.
+
+    Не перечисленные в need текстовые колонки заполняются пустыми строками.
+    """
+    batch = CommitBatch()
+    for commit_hash, timestamp, author, message in get_commits_between(repo_path, start_hash, min_date, end_hash, need):
+        batch.hashes.append(commit_hash)
+        batch.dates.append(timestamp)
+        batch.authors.append(author)
+        batch.messages.append(message)
+    # Генератор идёт от новых к старым — разворачиваем каждую колонку один раз
+    for column in (batch.hashes, batch.dates, batch.authors, batch.messages):
+        column.reverse()
+    return batch
+
+def get_commits_for_tags(repo_path: str, tag_names: List[str], min_date: datetime) -> Dict[str, CommitBatch]:
     """Получить коммиты для всех указанных тегов с фильтрацией по дате."""
-    commits_per_tag = {}
+    refs = _load_refs(repo_path)
+
+    # Сначала дёшево собираем (тег, старт, стоп) по ссылкам, затем обходим
+    # истории тегов параллельно: чтение объектов идемпотентно, а zlib
+    # отпускает GIL во время распаковки
+    triples = []
     previous_commit = None
     for tag_name in tag_names:
-        tag_commit = get_tag_commit(repo_path, tag_name)
-        commits = get_commits_between(repo_path, tag_commit, min_date, previous_commit)
-        commits_per_tag[tag_name] = commits
+        tag_commit = get_tag_commit(refs, tag_name)
+        triples.append((tag_name, tag_commit, previous_commit))
         previous_commit = tag_commit
+
+    # Прогреваем кэш стартовыми коммитами всех тегов одной пачкой чтений
+    read_git_objects_bulk(repo_path, [start for _, start, _ in triples])
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(
+            # Граф рендерит только хеши — автора и сообщение не извлекаем
+            lambda t: (t[0], _collect_commits(repo_path, t[1], min_date, t[2], need=frozenset())),
+            triples)
+        commits_per_tag = dict(results)
     return commits_per_tag
 
-def build_plantuml_graph(commits_per_tag: Dict[str, List[Tuple[str, str, str, str]]]) -> str:
+def build_plantuml_graph(commits_per_tag: Dict[str, CommitBatch]) -> str:
     """Создать граф в формате PlantUML из коммитов, используя только хеши в узлах."""
-    plantuml_code = '@startuml\n'
+    # Накапливаем строки в списке: конкатенация str в цикле квадратична по длине
+    parts = ['@startuml\n']
     for tag, commits in commits_per_tag.items():
-        plantuml_code += f'package "{tag}" {{\n'
-        for idx, (commit_hash, _, _, _) in enumerate(commits):
+        parts.append(f'package "{tag}" {{\n')
+        # Потоковый проход только по колонке хешей: узел и ребро к предыдущему
+        # пишутся сразу, остальные колонки не читаются вовсе
+        for idx, commit_hash in enumerate(commits.hashes):
             # Отображаем только хеш коммита в каждом узле
-            plantuml_code += f'node "{commit_hash}" as {tag}_{idx}\n'
-        for i in range(len(commits) - 1):
-            plantuml_code += f'{tag}_{i} --> {tag}_{i + 1}\n'
-        plantuml_code += '}\n'
-    plantuml_code += '@enduml'
-    return plantuml_code
+            parts.append(f'node "{commit_hash}" as {tag}_{idx}\n')
+            if idx:
+                parts.append(f'{tag}_{idx - 1} --> {tag}_{idx}\n')
+        parts.append('}\n')
+    parts.append('@enduml')
+    return ''.join(parts)
 
 def visualize_graph(plantuml_code: str, visualization_tool: str, output_image_path: str):
-    """Сохранить граф в файл и визуализировать его с помощью PlantUML."""
-    with open("graph.puml", "w") as f:
-        f.write(plantuml_code)
+    """Визуализировать граф с помощью PlantUML, передавая код через stdin.
 
-    command = f"java -jar \"{visualization_tool}\" -tpng graph.puml -o \"{output_image_path}\""
-    print(f"Executing command: {command}")  # Отладочная информация
-    result = os.system(command)
+    Код PlantUML уходит в процесс через -pipe, а PNG пишется сразу в итоговый
+    файл — без временного graph.puml и его удаления.
+    """
+    if os.path.isdir(output_image_path):
+        output_image_path = os.path.join(output_image_path, 'graph.png')
+
+    command = ['java', '-jar', visualization_tool, '-tpng', '-pipe']
+    print(f"Executing command: {' '.join(command)}")  # Отладочная информация
+    try:
+        with open(output_image_path, 'wb') as out:
+            result = subprocess.run(command, input=plantuml_code.encode('utf-8'), stdout=out)
+    except OSError as e:
+        raise Exception(f"Error visualizing graph: {str(e)}")
 
-    if result != 0:
+    if result.returncode != 0:
         raise Exception("Error visualizing graph. Please check the command and PlantUML setup.")
     else:
         print(f"PNG file successfully created at {output_image_path}!")
-    os.remove("graph.puml")
 
 def main(config_path: str):
     """Основная функция для загрузки конфигурации, получения коммитов и визуализации графа."""
+    read_git_object.cache_clear()  # Сбрасываем кэш объектов между запусками
     config = load_config_from_xml(config_path)
     print("Loaded config:", config)  # Отладочная информация
     